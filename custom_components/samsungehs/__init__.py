@@ -7,6 +7,7 @@ https://github.com/pantherale0/samsungehs
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
@@ -43,6 +44,9 @@ PLATFORMS: list[Platform] = [
 
 PLATFORM_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+# Upper bound for reading basic device info (model, serial, DB code) at setup.
+BASIC_INFO_TIMEOUT = 30
+
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Samsung EHS component."""
@@ -50,6 +54,33 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
+async def _async_fetch_basic_info(entry: SamsungEhsConfigEntry) -> None:
+    """Read basic device info for all subentries and signal discovery."""
+    client = entry.runtime_data.client
+    try:
+        # Issue all basic info reads concurrently so startup waits for the
+        # slowest round-trip instead of the sum of all of them.
+        async with asyncio.timeout(BASIC_INFO_TIMEOUT):
+            await asyncio.gather(
+                *(
+                    client.devices[subentry.unique_id].get_attribute(
+                        message, requires_read=True
+                    )
+                    for subentry in entry.subentries.values()
+                    if subentry.unique_id
+                    for message in (
+                        ProductModelName,
+                        SerialNumber,
+                        DbCodeMiComMainMessage,
+                    )
+                )
+            )
+    except TimeoutError:
+        LOGGER.warning("Timed out reading basic device info")
+    finally:
+        entry.runtime_data.discovery_ready.set()
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: SamsungEhsConfigEntry,
@@ -61,6 +92,9 @@ async def async_setup_entry(
         logger=LOGGER,
         name=DOMAIN,
         update_interval=timedelta(seconds=15),
+        # Entity state is pushed via device callbacks; the coordinator only
+        # schedules bus reads, so don't notify listeners on unchanged data.
+        always_update=False,
     )
 
     async def trigger_new_device(device: NasaDevice) -> None:
@@ -85,23 +119,16 @@ async def async_setup_entry(
     )
 
     try:
-        # Ensure connection is established and basic info is read
+        # Ensure connection is established
         await client.start()
-        for subentry in entry.subentries.values():
-            if not subentry.unique_id:
-                continue
-            await client.devices[subentry.unique_id].get_attribute(
-                ProductModelName, requires_read=True
-            )
-            await client.devices[subentry.unique_id].get_attribute(
-                SerialNumber, requires_read=True
-            )
-            await client.devices[subentry.unique_id].get_attribute(
-                DbCodeMiComMainMessage, requires_read=True
-            )
     except Exception as ex:
         await client.stop()
         raise ConfigEntryNotReady from ex
+    # Fetch basic info in the background so platform setup can overlap with
+    # the reads; platforms wait on discovery_ready before adding entities.
+    hass.async_create_task(
+        _async_fetch_basic_info(entry), eager_start=True
+    )
     # Setup platforms first to populate a list of messages to retrieve
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
@@ -123,6 +150,19 @@ async def async_reload_entry(
     entry: SamsungEhsConfigEntry,
 ) -> None:
     """Reload config entry."""
+    # Don't block the update listener on a full stop + reload cycle
+    hass.async_create_background_task(
+        _async_stop_and_reload(hass, entry),
+        name="samsungehs-reload",
+        eager_start=True,
+    )
+
+
+async def _async_stop_and_reload(
+    hass: HomeAssistant,
+    entry: SamsungEhsConfigEntry,
+) -> None:
+    """Stop the client and reload the config entry."""
     await entry.runtime_data.client.stop()
     await hass.config_entries.async_reload(entry.entry_id)
 
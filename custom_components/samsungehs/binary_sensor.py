@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from enum import StrEnum
+from enum import Enum, StrEnum
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.binary_sensor import (
@@ -12,14 +12,13 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
-from pysamsungnasa.helpers import Address
+from homeassistant.core import callback
 from pysamsungnasa.protocol.enum import (
     AddressClass,
     InOperationMode,
     InThermostatStatus,
     OutdoorCompressorLoad,
     OutdoorOperationStatus,
-    OutdoorPumpOutLoad,
 )
 from pysamsungnasa.protocol.factory.messages import indoor, outdoor
 
@@ -50,13 +49,19 @@ class SamsungEhsBinarySensorKey(StrEnum):
     INDOOR_Z2_HEATING_ON = "indoor_z2_heating_on"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SamsungEhsBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Description for Samsung EHS binary sensor entities."""
 
     requires_read: bool = False
     message: type[BaseMessage] | None = None
     messages_expected_value: Any | None = None
+    message_id: int | None = None
+
+    def __post_init__(self) -> None:
+        """Resolve the message ID once so state reads skip the class attribute."""
+        if self.message is not None and self.message_id is None:
+            object.__setattr__(self, "message_id", self.message.MESSAGE_ID)
 
 
 # Define entity description for outdoor unit
@@ -132,6 +137,13 @@ INDOOR_ENTITY_DESCRIPTIONS = (
     ),
 )
 
+DESCRIPTIONS_BY_CLASS: dict[
+    AddressClass, tuple[SamsungEhsBinarySensorEntityDescription, ...]
+] = {
+    AddressClass.OUTDOOR: OUTDOOR_ENTITY_DESCRIPTIONS,
+    AddressClass.INDOOR: INDOOR_ENTITY_DESCRIPTIONS,
+}
+
 
 async def async_setup_entry(
     _: HomeAssistant,
@@ -139,35 +151,21 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up the binary sensor platform."""
-    # Register devices in the device registry
-    for subentry in entry.subentries.values():
-        if not isinstance(subentry.unique_id, str):
-            continue
-        address = Address.parse(subentry.unique_id)
-        if address.class_id == AddressClass.OUTDOOR:
-            # Add outdoor sensors
-            async_add_entities(
-                (
-                    SamsungEhsBinarySensor(
-                        coordinator=entry.runtime_data.coordinator,
-                        entity_description=entity_description,
-                        subentry=subentry,
-                    )
-                    for entity_description in OUTDOOR_ENTITY_DESCRIPTIONS
-                ),
-                config_subentry_id=subentry.subentry_id,
-            )
-        elif address.class_id == AddressClass.INDOOR:
-            # Add indoor sensors
+    # Wait for basic device info before adding entities
+    await entry.runtime_data.discovery_ready.wait()
+    coordinator = entry.runtime_data.coordinator
+    for class_id, descriptions in DESCRIPTIONS_BY_CLASS.items():
+        for subentry in coordinator.subentries_by_class.get(class_id, ()):
+            # Register all sensors for this subentry in one batch
             async_add_entities(
-                (
+                [
                     SamsungEhsBinarySensor(
-                        coordinator=entry.runtime_data.coordinator,
+                        coordinator=coordinator,
                         entity_description=entity_description,
                         subentry=subentry,
                     )
-                    for entity_description in INDOOR_ENTITY_DESCRIPTIONS
-                ),
+                    for entity_description in descriptions
+                ],
                 config_subentry_id=subentry.subentry_id,
             )
 
@@ -192,12 +190,25 @@ class SamsungEhsBinarySensor(SamsungEhsEntity, BinarySensorEntity):
         self.entity_description: SamsungEhsBinarySensorEntityDescription = (
             entity_description
         )
+        # Enum members are singletons, so identity is enough (and cheaper
+        # than __eq__ dispatch) when the expected value is an enum.
+        self._expected_is_enum = isinstance(
+            entity_description.messages_expected_value, Enum
+        )
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the binary_sensor is on."""
-        if self._device is None:
-            return None
-        return self.entity_description.messages_expected_value == self.get_attribute(
-            self.entity_description.message
+    @callback
+    def _update_attrs(self) -> None:
+        """Recompute the cached boolean state."""
+        message_id = self.entity_description.message_id
+        if message_id is None:
+            self._attr_is_on = None
+            return
+        try:
+            value = self._device.attributes[message_id].VALUE
+        except KeyError:
+            self._attr_is_on = None
+            return
+        expected = self.entity_description.messages_expected_value
+        self._attr_is_on = (
+            expected is value if self._expected_is_enum else expected == value
         )
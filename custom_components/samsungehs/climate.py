@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, ClassVar
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar, Final
 
 from homeassistant.components.climate import ClimateEntity
 from homeassistant.components.climate.const import (
@@ -11,7 +12,7 @@ from homeassistant.components.climate.const import (
     HVACMode,
 )
 from homeassistant.const import UnitOfTemperature
-from pysamsungnasa.helpers import Address
+from homeassistant.core import callback
 from pysamsungnasa.protocol.enum import (
     AddressClass,
     InOperationMode,
@@ -50,15 +51,60 @@ if TYPE_CHECKING:
 
     from .data import SamsungEhsConfigEntry
 
-EHS_OP_TO_HASS = {
-    InOperationMode.AUTO: HVACMode.AUTO,
-    InOperationMode.COOL: HVACMode.COOL,
-    InOperationMode.HEAT: HVACMode.HEAT,
-    InOperationMode.FAN: HVACMode.FAN_ONLY,
-    None: HVACMode.OFF,
+EHS_OP_TO_HASS: Final = MappingProxyType(
+    {
+        InOperationMode.AUTO: HVACMode.AUTO,
+        InOperationMode.COOL: HVACMode.COOL,
+        InOperationMode.HEAT: HVACMode.HEAT,
+        InOperationMode.FAN: HVACMode.FAN_ONLY,
+        None: HVACMode.OFF,
+    }
+)
+
+HASS_TO_EHS_OP: Final = MappingProxyType({v: k for k, v in EHS_OP_TO_HASS.items()})
+
+# Prebound lookups for the hot paths
+_EHS_TO_HASS_GET: Final = EHS_OP_TO_HASS.get
+_HASS_TO_EHS_GET: Final = HASS_TO_EHS_OP.__getitem__
+
+# Deduplicated (OFF maps from two sources) and built once at import.
+_HVAC_MODES: Final[list[HVACMode]] = list(dict.fromkeys(EHS_OP_TO_HASS.values()))
+
+# Map control mode to the (current, target) temperature message IDs.
+_TEMP_MODE_MAP: Final[dict[str | None, tuple[int, int]]] = {
+    "target_room_temperature": (
+        InRoomTemperature.MESSAGE_ID,
+        InTargetTemperature.MESSAGE_ID,
+    ),
+    "target_water_temperature": (
+        IndoorFlowTemperature.MESSAGE_ID,
+        InWaterOutletTargetTemperature.MESSAGE_ID,
+    ),
+    "water_law_offset": (
+        InWaterLawTargetTemperature.MESSAGE_ID,
+        InWaterLawTargetTemperature.MESSAGE_ID,
+    ),
+}
+
+
+# Actively conditioning combinations; anything else falls back to IDLE.
+_HVAC_ACTION_TABLE: Final = {
+    (HVACMode.COOL, OutdoorOperationStatus.OP_NORMAL): HVACAction.COOLING,
+    (HVACMode.HEAT, OutdoorOperationStatus.OP_NORMAL): HVACAction.HEATING,
 }
 
-HASS_TO_EHS_OP = {v: k for k, v in EHS_OP_TO_HASS.items()}
+# Message IDs used on every entity add, resolved once at import.
+_OUT_STATUS_MID: Final = OutdoorOperationStatusMessage.MESSAGE_ID
+_OUT_DEFROST_MID: Final = OutdoorDefrostStatus.MESSAGE_ID
+
+
+def _as_float(value: Any) -> float | None:
+    """Coerce a message value to float, fast-pathing the common case."""
+    if type(value) is float:
+        return value
+    if value is None or isinstance(value, str):
+        return None
+    return float(value)
 
 
 async def async_setup_entry(
@@ -67,25 +113,25 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up the water heater platform."""
-    for subentry in entry.subentries.values():
-        assert subentry.unique_id is not None  # noqa: S101
-        address = Address.parse(subentry.unique_id)
-        if address.class_id == AddressClass.INDOOR:
-            async_add_entities(
-                [
-                    SamsungEhsClimate(
-                        coordinator=entry.runtime_data.coordinator,
-                        subentry=subentry,
-                    )
-                ],
-                config_subentry_id=subentry.subentry_id,
-            )
+    # Wait for basic device info before adding entities
+    await entry.runtime_data.discovery_ready.wait()
+    coordinator = entry.runtime_data.coordinator
+    for subentry in coordinator.subentries_by_class.get(AddressClass.INDOOR, ()):
+        async_add_entities(
+            [
+                SamsungEhsClimate(
+                    coordinator=coordinator,
+                    subentry=subentry,
+                )
+            ],
+            config_subentry_id=subentry.subentry_id,
+        )
 
 
 class SamsungEhsClimate(SamsungEhsEntity, ClimateEntity):
     """Samsung EHS Climate."""
 
-    _attr_hvac_modes: ClassVar[list[HVACMode]] = list(EHS_OP_TO_HASS.values())
+    _attr_hvac_modes: ClassVar[list[HVACMode]] = _HVAC_MODES
     _attr_supported_features = (
         ClimateEntityFeature.TURN_OFF
         | ClimateEntityFeature.TURN_ON
@@ -94,6 +140,8 @@ class SamsungEhsClimate(SamsungEhsEntity, ClimateEntity):
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_translation_key = "heating"
     _attr_target_temperature_step = 0.1
+    _attr_min_temp = -5.0
+    _attr_max_temp = 50.0
 
     def __init__(
         self,
@@ -108,91 +156,43 @@ class SamsungEhsClimate(SamsungEhsEntity, ClimateEntity):
             key="heating",
         )  # No message number for this mode.
 
-    @property
-    def current_temperature(self) -> float | None:
-        """Return current temperature."""
-        if not self.available:
-            return None
-        control_mode = get_temperature_control_mode(self._device)
-        if control_mode == "target_room_temperature":
-            value = self.get_attribute(InRoomTemperature)
-        elif control_mode == "target_water_temperature":
-            value = self.get_attribute(IndoorFlowTemperature)
-        elif control_mode == "water_law_offset":
-            value = self.get_attribute(InWaterLawTargetTemperature)
+    @callback
+    def _update_attrs(self) -> None:
+        """Recompute cached climate state from device attributes."""
+        message_ids = _TEMP_MODE_MAP.get(get_temperature_control_mode(self._device))
+        if message_ids is None:
+            current = target = None
         else:
-            return None
-        return (
-            float(value) if value is not None and not isinstance(value, str) else None
-        )
-
-    @property
-    def target_temperature(self) -> float | None:
-        """Return target temperature."""
-        if not self.available:
-            return None
-        control_mode = get_temperature_control_mode(self._device)
-        if control_mode == "target_room_temperature":
-            value = self.get_attribute(InTargetTemperature)
-        elif control_mode == "target_water_temperature":
-            value = self.get_attribute(InWaterOutletTargetTemperature)
-        elif control_mode == "water_law_offset":
-            value = self.get_attribute(InWaterLawTargetTemperature)
+            attributes = self._device.attributes
+            current_attr = attributes.get(message_ids[0])
+            target_attr = attributes.get(message_ids[1])
+            current = current_attr.VALUE if current_attr is not None else None
+            target = target_attr.VALUE if target_attr is not None else None
+        self._attr_current_temperature = _as_float(current)
+        self._attr_target_temperature = _as_float(target)
+
+        power = self.get_attribute(InOperationPowerMessage)
+        out_status = self.get_attribute(OutdoorOperationStatusMessage)
+        if power is InOperationPower.OFF:
+            mode = HVACMode.OFF
         else:
-            return None
-        return (
-            float(value) if value is not None and not isinstance(value, str) else None
-        )
-
-    @property
-    def hvac_mode(self) -> HVACMode | None:
-        """Return the current operation."""
-        if not self.available:
-            return None
-        if self.get_attribute(InOperationPowerMessage) == InOperationPower.OFF:
-            return HVACMode.OFF
-        return EHS_OP_TO_HASS.get(self.get_attribute(InOperationModeMessage))
-
-    @property
-    def hvac_action(self) -> HVACAction | None:
-        """Return the current operation."""
-        if (
-            self.hvac_mode == HVACMode.COOL
-            and self.get_attribute(InOperationPowerMessage) != InOperationPower.OFF
-            and self.get_attribute(OutdoorOperationStatusMessage)
-            == OutdoorOperationStatus.OP_NORMAL
-        ):
-            return HVACAction.COOLING
-        if (
-            self.hvac_mode == HVACMode.HEAT
-            and self.get_attribute(InOperationPowerMessage) != InOperationPower.OFF
-            and self.get_attribute(OutdoorOperationStatusMessage)
-            == OutdoorOperationStatus.OP_NORMAL
-        ):
-            return HVACAction.HEATING
-        if (
-            self.get_attribute(OutdoorOperationStatusMessage)
-            == OutdoorOperationStatus.OP_SAFETY
-        ):
-            return HVACAction.PREHEATING
-        if self.get_attribute(OutdoorOperationStatusMessage) in [
+            mode = _EHS_TO_HASS_GET(self.get_attribute(InOperationModeMessage))
+        self._attr_hvac_mode = mode
+        if power is InOperationPower.OFF:
+            action = HVACAction.OFF
+        elif out_status is OutdoorOperationStatus.OP_SAFETY:
+            action = HVACAction.PREHEATING
+        elif out_status in (
             OutdoorOperationStatus.OP_DEICE,
             OutdoorOperationStatus.OP_NONSTOP_DEICE,
-        ]:
-            return HVACAction.DEFROSTING
-        if self.get_attribute(InOperationPowerMessage) == InOperationPower.OFF:
-            return HVACAction.OFF
-        return HVACAction.IDLE
-
-    @property
-    def min_temp(self) -> float | None:
-        """Return the minimum temperature."""
-        return -5.0
-
-    @property
-    def max_temp(self) -> float | None:
-        """Return the maximum temperature."""
-        return 50.0
+        ) or self.get_attribute(OutdoorDefrostStatus) not in (
+            None,
+            OutdoorIndoorDefrostStep.NO_DEFROST_OPERATION,
+        ):
+            action = HVACAction.DEFROSTING
+        else:
+            action = _HVAC_ACTION_TABLE.get((mode, out_status), HVACAction.IDLE)
+        self._attr_hvac_action = action
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
@@ -207,7 +207,7 @@ class SamsungEhsClimate(SamsungEhsEntity, ClimateEntity):
                 await self.async_turn_off()
                 return
             await self._device.write_attribute(
-                InOperationModeMessage, HASS_TO_EHS_OP[hvac_mode]
+                InOperationModeMessage, _HASS_TO_EHS_GET(hvac_mode)
             )
             await self.async_turn_on()
 
@@ -223,22 +223,16 @@ class SamsungEhsClimate(SamsungEhsEntity, ClimateEntity):
             InOperationPowerMessage, InOperationPower.ON_STATE_1
         )
 
-    def _handle_packet(self, *_args: Any, **__kwargs: Any) -> None:
-        """Handle incoming packets."""
-        self.async_schedule_update_ha_state()
-
     async def async_added_to_hass(self) -> None:
         """Call when the entity is added to HASS."""
         # We need to add a subscription for the outdoor operation status to determine hvac_action  # noqa: E501
-        self.coordinator.config_entry.runtime_data.client.parser.add_packet_listener(
-            OutdoorOperationStatusMessage.MESSAGE_ID, self._device.handle_packet
-        )
-        self.coordinator.config_entry.runtime_data.client.parser.add_packet_listener(
-            OutdoorDefrostStatus.MESSAGE_ID, self._device.handle_packet
-        )
-        self.coordinator.config_entry.runtime_data.client.parser.add_packet_listener(
-            OutdoorOperationStatusMessage.MESSAGE_ID,
-            self._handle_packet,
+        # Bound methods hash by (instance, function), so the coordinator can
+        # deduplicate the per-device fan-out across climate entities.
+        handle_packet = self._device.handle_packet
+        self.coordinator.ensure_packet_listener(_OUT_STATUS_MID, handle_packet)
+        self.coordinator.ensure_packet_listener(_OUT_DEFROST_MID, handle_packet)
+        self.coordinator.ensure_packet_listener(
+            _OUT_STATUS_MID, self._handle_device_update
         )
         # Read initial values
         self._add_first_run_message(OutdoorOperationStatusMessage)
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+from itertools import batched
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from pysamsungnasa.helpers import Address
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.config_entries import ConfigSubentry
+    from pysamsungnasa.protocol.enum import AddressClass
+
     from .data import SamsungEhsConfigEntry
 
 
@@ -14,39 +22,72 @@ class SamsungEhsDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from Samsung NASA."""
 
     config_entry: SamsungEhsConfigEntry
-    _first_refresh: bool = True
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the coordinator."""
+        super().__init__(*args, **kwargs)
+        self._first_refresh = True
+        # Parser listeners already registered, keyed by (message_id, listener)
+        # so repeated entity adds don't stack duplicate subscriptions.
+        self._packet_listeners: set[tuple[int, Callable]] = set()
+        # Subentries with a valid address, classified once so every platform
+        # setup is a dict lookup instead of re-parsing unique IDs.
+        self.subentries_by_class: dict[AddressClass, list[ConfigSubentry]] = {}
+        for subentry in self.config_entry.subentries.values():
+            if isinstance(subentry.unique_id, str):
+                self.subentries_by_class.setdefault(
+                    Address.parse(subentry.unique_id).class_id, []
+                ).append(subentry)
+
+    def ensure_packet_listener(self, message_id: int, listener: Callable) -> None:
+        """Register a parser packet listener once per (message, listener) pair."""
+        key = (message_id, listener)
+        if key in self._packet_listeners:
+            return
+        self._packet_listeners.add(key)
+        self.config_entry.runtime_data.client.parser.add_packet_listener(
+            message_id, listener
+        )
 
     async def _async_update_data(self) -> Any:
         """Update data via library."""
         if not self.config_entry.runtime_data.client.client.is_connected:
             # Attempt to reconnect
             await self.config_entry.runtime_data.client.start()
+        runtime_data = self.config_entry.runtime_data
+        # Nothing registered means nothing to read this tick
+        if not runtime_data.messages_to_read and not self._first_refresh:
+            return True
         if self._first_refresh:
-            # Add all messages that need to be read on first run
-            for (
-                device_address,
-                messages,
-            ) in self.config_entry.runtime_data.first_run_messages.items():
-                for i in range(0, len(messages), 10):
-                    batch = messages[i : i + 10]
-                    await self.config_entry.runtime_data.client.client.nasa_read(
-                        batch, device_address
-                    )
+            # Read all messages registered for first run
+            await self._async_read_messages(runtime_data.first_run_messages)
             self._first_refresh = False
 
-        # Messages can only be read in batches of 10
-        for (
-            device_address,
-            messages,
-        ) in self.config_entry.runtime_data.messages_to_read.items():
-            for i in range(0, len(messages), 10):
-                batch = messages[i : i + 10]
-                await self.config_entry.runtime_data.client.client.nasa_read(
-                    batch, device_address
-                )
+        # Steady-state reads reuse the batch plan cached on runtime_data
+        nasa_read = runtime_data.client.client.nasa_read
+        tasks = [
+            nasa_read(batch, device_address)
+            for device_address in runtime_data.messages_to_read
+            for batch in runtime_data.read_batches(device_address)
+        ]
+        if tasks:
+            await asyncio.gather(*tasks)
 
         return True
 
+    async def _async_read_messages(self, registry: dict[str, set[int]]) -> None:
+        """Issue the registered reads for all devices concurrently."""
+        client = self.config_entry.runtime_data.client.client
+        # Messages can only be read in batches of 10; the batches are
+        # independent requests, so fire them together and wait once.
+        tasks = [
+            client.nasa_read(batch, device_address)
+            for device_address, messages in registry.items()
+            for batch in batched(sorted(messages), 10)
+        ]
+        if tasks:
+            await asyncio.gather(*tasks)
+
     async def write_message(
         self, device_address: str, request_type: Any, message: Any
     ) -> None:
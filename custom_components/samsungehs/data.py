@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
+from itertools import batched
 from typing import TYPE_CHECKING
 
 from homeassistant.config_entries import ConfigEntry
 
 if TYPE_CHECKING:
+    from homeassistant.helpers.device_registry import DeviceInfo
     from pysamsungnasa import SamsungNasa
 
     from .coordinator import SamsungEhsDataUpdateCoordinator
@@ -19,8 +22,37 @@ class SamsungEhsData:
 
     client: SamsungNasa
     coordinator: SamsungEhsDataUpdateCoordinator
-    messages_to_read: dict[str, list[int]] = field(default_factory=dict)
-    first_run_messages: dict[str, list[int]] = field(default_factory=dict)
+    # Message IDs registered per device address; sets so repeated entity
+    # adds and reloads can't queue duplicate reads.
+    messages_to_read: dict[str, set[int]] = field(default_factory=dict)
+    first_run_messages: dict[str, set[int]] = field(default_factory=dict)
+    # Set once basic device info has been fetched; platforms wait on this
+    # so their setup can overlap with the initial reads.
+    discovery_ready: asyncio.Event = field(default_factory=asyncio.Event)
+    # DeviceInfo shared by all entities of a device, keyed by the entity
+    # device identifier; built once instead of per entity.
+    device_infos: dict[str, DeviceInfo] = field(default_factory=dict)
+    # Per-device read batches, rebuilt lazily after registrations change.
+    _read_batches: dict[str, tuple[tuple[int, ...], ...]] = field(
+        default_factory=dict
+    )
+
+    def add_message_to_read(self, device_address: str, message_id: int) -> None:
+        """Register a periodic read and invalidate the device's batch cache."""
+        messages = self.messages_to_read.setdefault(device_address, set())
+        if message_id not in messages:
+            messages.add(message_id)
+            self._read_batches.pop(device_address, None)
+
+    def read_batches(self, device_address: str) -> tuple[tuple[int, ...], ...]:
+        """Return the 10-message read batches for a device, cached until changed."""
+        batches = self._read_batches.get(device_address)
+        if batches is None:
+            batches = tuple(
+                batched(sorted(self.messages_to_read[device_address]), 10)
+            )
+            self._read_batches[device_address] = batches
+        return batches
 
 
 type SamsungEhsConfigEntry = ConfigEntry[SamsungEhsData]
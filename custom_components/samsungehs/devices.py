@@ -1,10 +1,16 @@
 """Handlers to register and manage Samsung EHS devices in device registry."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from homeassistant.config_entries import ConfigSubentry
-from homeassistant.core import HomeAssistant
-from pysamsungnasa.device import NasaDevice
 
-from .data import SamsungEhsConfigEntry
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from pysamsungnasa.device import NasaDevice
+
+    from .data import SamsungEhsConfigEntry
 
 
 async def async_trigger_discovered_device(
@@ -25,7 +31,8 @@ async def async_trigger_discovered_device(
             subentry_type="device",
             title=address,
             unique_id=address,
-            data={},  # type: ignore[arg-type]
+            # Persist the address class so it never needs re-deriving
+            data={"class_id": device.device_type.value},  # type: ignore[arg-type]
         ),
     )
     hass.config_entries.async_schedule_reload(entry.entry_id)
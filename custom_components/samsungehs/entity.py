@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import sys
+from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from pysamsungnasa.protocol.factory.messages.basic import (
@@ -13,9 +16,13 @@ from pysamsungnasa.protocol.factory.messages.basic import (
 )
 from pysamsungnasa.protocol.factory.types import BaseMessage
 
-from .const import DOMAIN
+from .const import DOMAIN, LOGGER
 from .coordinator import SamsungEhsDataUpdateCoordinator
 
+# Device pushes arrive in bursts (one per message); coalesce state writes
+# within this window instead of re-rendering per packet.
+UPDATE_DEBOUNCE_COOLDOWN = 0.05
+
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigSubentry
     from pysamsungnasa.device import NasaDevice
@@ -36,35 +43,47 @@ class SamsungEhsEntity(CoordinatorEntity[SamsungEhsDataUpdateCoordinator]):
     ) -> None:
         """Initialize."""
         super().__init__(coordinator)
+        # Cache the client so hot properties don't walk the full
+        # coordinator -> config_entry -> runtime_data attribute chain.
+        self._client = coordinator.config_entry.runtime_data.client
+        self._device_cache: NasaDevice | None = None
+        # One bound method shared by add/remove so the library sees the
+        # identical callback object and no per-call rebinding happens.
+        self._on_device_update = self._handle_device_update
+        self._update_debouncer: Debouncer | None = None
         self.entry_id = subentry.subentry_id
         assert subentry.unique_id is not None  # noqa: S101
         address = subentry.unique_id
         self._device_address = address
-        self._attr_unique_id = f"{self.entry_id}_{self._device_address}_{key}"
+        # Interned so the device registry's identifier lookups hit the
+        # pointer-equality fast path instead of comparing bytes.
+        self._device_identifier = sys.intern(f"{self.entry_id}_{address}")
+        self._attr_unique_id = f"{self._device_identifier}_{key}"
         self._message = message
-        if (
-            requires_read
-            and self._device_address is not None
-            and self._message is not None
-            and self._message.MESSAGE_ID is not None
-        ):
-            coordinator.config_entry.runtime_data.messages_to_read.setdefault(
-                self._device_address, []
-            ).append(self._message.MESSAGE_ID)
+        # Resolved once; hot paths read this instead of the class attribute
+        self._message_id = message.MESSAGE_ID if message is not None else None
+        if requires_read and self._message_id is not None:
+            coordinator.config_entry.runtime_data.add_message_to_read(
+                self._device_address, self._message_id
+            )
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return (
             super().available
-            and self._device_address
-            in self.coordinator.config_entry.runtime_data.client.devices
-            and self.coordinator.config_entry.runtime_data.client.client.is_connected
+            and self._device_address in self._client.devices
+            and self._client.client.is_connected
         )
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return the device info."""
+        # All entities of a device describe the same hardware; build once
+        device_infos = self.coordinator.config_entry.runtime_data.device_infos
+        cached = device_infos.get(self._device_identifier)
+        if cached is not None:
+            return cached
         model = self.get_attribute(ProductModelName)
         if model is not None and isinstance(model, dict):
             model_name = model.get("model_name", "Samsung EHS")
@@ -80,13 +99,8 @@ class SamsungEhsEntity(CoordinatorEntity[SamsungEhsDataUpdateCoordinator]):
         dbcode = self.get_attribute(DbCodeMiComMainMessage)
         if dbcode is not None:
             dbcode = str(dbcode)
-        return DeviceInfo(
-            identifiers={
-                (
-                    DOMAIN,
-                    f"{self.entry_id}_{self._device_address}",
-                )
-            },
+        info = DeviceInfo(
+            identifiers={(DOMAIN, self._device_identifier)},
             manufacturer="Samsung",
             name=self._device_address,
             model=model_name,
@@ -94,26 +108,22 @@ class SamsungEhsEntity(CoordinatorEntity[SamsungEhsDataUpdateCoordinator]):
             sw_version=dbcode,
             serial_number=serial_number,
         )
+        device_infos[self._device_identifier] = info
+        return info
 
     @property
     def _device(self) -> NasaDevice:
         """Return the device associated with this entity."""
-        return self.coordinator.config_entry.runtime_data.client.devices[
-            self._device_address
-        ]
+        device = self._device_cache
+        if device is None:
+            device = self._device_cache = self._client.devices[self._device_address]
+        return device
 
     def get_attribute(
         self, message: type[BaseMessage] | None = None
     ) -> str | int | float | dict | bool | None:
         """Get the attribute value for this entity."""
-        if not isinstance(message, type) or (
-            not issubclass(message, BaseMessage) and message is not None
-        ):
-            return None
-        message_number = (
-            self._message.MESSAGE_ID if message is None else message.MESSAGE_ID
-        )
-        assert message_number is not None  # noqa: S101
+        message_number = self._message_id if message is None else message.MESSAGE_ID
         if message_number is None:
             return None
         attribute = self._device.attributes.get(message_number)
@@ -121,12 +131,44 @@ class SamsungEhsEntity(CoordinatorEntity[SamsungEhsDataUpdateCoordinator]):
             return None
         return attribute.VALUE
 
+    @callback
+    def _update_attrs(self) -> None:
+        """
+        Recompute cached ``_attr_*`` state from device attributes.
+
+        Subclasses that cache derived state override this; it runs on every
+        device callback and coordinator refresh so properties stay a plain
+        attribute load.
+        """
+
+    @callback
+    def _handle_device_update(self, *_args: Any, **_kwargs: Any) -> None:
+        """Handle a pushed update from the device."""
+        if self._update_debouncer is not None:
+            self._update_debouncer.async_schedule_call()
+            return
+        self._update_attrs()
+        self.async_schedule_update_ha_state()
+
+    @callback
+    def _async_write_debounced_state(self) -> None:
+        """Recompute cached state and write it after the debounce window."""
+        self._update_attrs()
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle a coordinator refresh."""
+        if self._device_address in self._client.devices:
+            self._update_attrs()
+        super()._handle_coordinator_update()
+
     def _add_first_run_message(self, message: type[BaseMessage]) -> None:
         """Add a message to be read on first run."""
         if self._device_address is not None and message.MESSAGE_ID is not None:
             self.coordinator.config_entry.runtime_data.first_run_messages.setdefault(
-                self._device_address, []
-            ).append(message.MESSAGE_ID)
+                self._device_address, set()
+            ).add(message.MESSAGE_ID)
 
     async def async_added_to_hass(self) -> None:
         """Call when the entity is added to HASS."""
@@ -137,9 +179,22 @@ class SamsungEhsEntity(CoordinatorEntity[SamsungEhsDataUpdateCoordinator]):
         if self._message:
             self._add_first_run_message(self._message)
 
-        self._device.add_device_callback(self.async_schedule_update_ha_state)
+        self._update_debouncer = Debouncer(
+            self.hass,
+            LOGGER,
+            cooldown=UPDATE_DEBOUNCE_COOLDOWN,
+            immediate=True,
+            function=self._async_write_debounced_state,
+        )
+        self._device.add_device_callback(self._on_device_update)
+        # Seed cached state so the first written state isn't empty
+        self._update_attrs()
 
     async def async_will_remove_from_hass(self) -> None:
         """Call when the entity is about to be removed from HASS."""
         await super().async_will_remove_from_hass()
-        self._device.remove_device_callback(self.async_schedule_update_ha_state)
+        self._device.remove_device_callback(self._on_device_update)
+        if self._update_debouncer is not None:
+            self._update_debouncer.async_cancel()
+            self._update_debouncer = None
+        self._device_cache = None
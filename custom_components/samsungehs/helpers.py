@@ -1,6 +1,7 @@
 """Samsung EHS helper functions."""
 
-from typing import Any
+from functools import cache
+from typing import Any, Final
 
 from pysamsungnasa.device import NasaDevice
 from pysamsungnasa.protocol.enum import DataType, InOperationMode, SamsungEnum
@@ -15,6 +16,23 @@ from pysamsungnasa.protocol.factory.messages.indoor import (
 from pysamsungnasa.protocol.factory.types import BaseMessage
 
 
+# Messages that must be present before the control mode can be derived
+_CONTROL_MODE_REQUIRED: Final = frozenset(
+    {
+        InOperationModeMessage.MESSAGE_ID,
+        InFsv2091UseThermostat1.MESSAGE_ID,
+        InFsv2092UseThermostat2.MESSAGE_ID,
+    }
+)
+
+# Control mode -> message accepting the target temperature write
+_TEMP_MODE_MSG: Final[dict[str | None, type[BaseMessage]]] = {
+    "target_water_temperature": InWaterOutletTargetTemperature,
+    "water_law_offset": InWaterLawTargetTemperature,
+    "target_room_temperature": InTargetTemperature,
+}
+
+
 def get_temperature_control_mode(device: NasaDevice) -> str | None:
     """
     Return the temperature control mode of the device.
@@ -22,22 +40,13 @@ def get_temperature_control_mode(device: NasaDevice) -> str | None:
     Modes: target water temperature, target room temperature, water law offset.
     """
     # Check required attributes are present in device
-    required_messages = [
-        InOperationModeMessage.MESSAGE_ID,
-        InFsv2091UseThermostat1.MESSAGE_ID,
-        InFsv2092UseThermostat2.MESSAGE_ID,
-    ]
-    if not all(msg in device.attributes for msg in required_messages):
+    attributes = device.attributes
+    if not _CONTROL_MODE_REQUIRED.issubset(attributes):
         return None
-    if device.attributes[InOperationModeMessage.MESSAGE_ID].VALUE in [
-        InOperationMode.HEAT,
-        InOperationMode.COOL,
-    ]:
+    operation_mode = attributes[InOperationModeMessage.MESSAGE_ID].VALUE
+    if operation_mode in (InOperationMode.HEAT, InOperationMode.COOL):
         return "target_water_temperature"
-    if (
-        device.attributes[InOperationModeMessage.MESSAGE_ID].VALUE
-        == InOperationMode.AUTO
-    ):
+    if operation_mode is InOperationMode.AUTO:
         return "water_law_offset"
     return "target_room_temperature"
 
@@ -46,20 +55,9 @@ async def async_set_space_heating_target_temperature(
     device: NasaDevice, temperature: float
 ) -> None:
     """Set target temperature for space heating mode based on the current control mode."""
-    if get_temperature_control_mode(device) == "target_water_temperature":
-        await device.write_attribute(
-            InWaterOutletTargetTemperature, temperature, mode=DataType.REQUEST
-        )
-    elif get_temperature_control_mode(device) == "water_law_offset":
-        await device.write_attribute(
-            InWaterLawTargetTemperature, temperature, mode=DataType.REQUEST
-        )
-    elif get_temperature_control_mode(device) == "target_room_temperature":
-        await device.write_attribute(
-            InTargetTemperature, temperature, mode=DataType.REQUEST
-        )
-    else:
-        return
+    message = _TEMP_MODE_MSG.get(get_temperature_control_mode(device))
+    if message is not None:
+        await device.write_attribute(message, temperature, mode=DataType.REQUEST)
 
 
 def get_dict_value(
@@ -68,14 +66,13 @@ def get_dict_value(
     default: Any = None,
 ) -> Any:
     """Get a value from a message attribute that is a dictionary."""
-    if message.VALUE is None:
-        return default
     value = message.VALUE
-    if not isinstance(value, dict):
-        return value
-    return value.get(key, default)
+    if isinstance(value, dict):
+        return value.get(key, default)
+    return default if value is None else value
 
 
-def convert_enum_to_select_options(enum_class: type[SamsungEnum]) -> list[str]:
-    """Convert a SamsungEnum class to a list of select options."""
-    return [member.name.replace("_", " ").lower() for member in enum_class]
+@cache
+def convert_enum_to_select_options(enum_class: type[SamsungEnum]) -> tuple[str, ...]:
+    """Convert a SamsungEnum class to a tuple of select options."""
+    return tuple(member.name.replace("_", " ").lower() for member in enum_class)
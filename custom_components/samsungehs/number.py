@@ -5,7 +5,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import StrEnum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from homeassistant.components.number import (
     NumberEntity,
@@ -13,7 +13,7 @@ from homeassistant.components.number import (
     NumberMode,
 )
 from homeassistant.const import PERCENTAGE, UnitOfTime, UnitOfTemperature
-from pysamsungnasa.helpers import Address
+from homeassistant.core import callback
 from pysamsungnasa.protocol.enum import (
     AddressClass,
 )
@@ -71,6 +71,9 @@ class SamsungEHSNumberEntityDescription(NumberEntityDescription):
     requires_read: bool = False
 
 
+# Resolved at import so the description lambdas don't re-read the class attr
+_FREQ_MSG_ID: Final = InOutdoorCompressorFrequencyRateControlMessage.MESSAGE_ID
+
 NUMBERS: tuple[SamsungEHSNumberEntityDescription, ...] = (
     SamsungEHSNumberEntityDescription(
         key=SamsungEHSNumberKey.FREQUENCY_RATIO_CONTROL_PERCENT,
@@ -79,22 +82,19 @@ NUMBERS: tuple[SamsungEHSNumberEntityDescription, ...] = (
             InOutdoorCompressorFrequencyRateControlMessage,
             value={"frequency_ratio_percent": int(value)},
         ),
-        value_fn=lambda device: get_dict_value(
-            device.attributes[
-                InOutdoorCompressorFrequencyRateControlMessage.MESSAGE_ID
-            ],
-            "frequency_ratio_percent",
-        )
-        if InOutdoorCompressorFrequencyRateControlMessage.MESSAGE_ID is not None
-        else None,
+        value_fn=lambda device, _mid=_FREQ_MSG_ID: get_dict_value(
+            device.attributes[_mid], "frequency_ratio_percent"
+        ),
         translation_key=SamsungEHSNumberKey.FREQUENCY_RATIO_CONTROL_PERCENT,
         requires_read=True,
         native_step=10.0,
         native_min_value=50.0,
         native_max_value=150.0,
         native_unit_of_measurement=PERCENTAGE,
-        available_fn=lambda entity: entity.get_attribute(InFsv5051) is not None
-        and bool(entity.get_attribute(InFsv5051)),
+        available_fn=lambda entity, _mid=InFsv5051.MESSAGE_ID: (
+            (attribute := entity._device.attributes.get(_mid)) is not None  # noqa: SLF001
+            and bool(attribute.VALUE)
+        ),
     ),
     SamsungEHSNumberEntityDescription(
         key=SamsungEHSNumberKey.DHW_DISINFECTION_START_HOUR,
@@ -203,14 +203,13 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up Samsung EHS number based on a config entry."""
-    for subentry in entry.subentries.values():
-        if not subentry.unique_id:
-            continue
-        if Address.parse(subentry.unique_id).class_id != AddressClass.INDOOR:
-            continue
+    # Wait for basic device info before adding entities
+    await entry.runtime_data.discovery_ready.wait()
+    coordinator = entry.runtime_data.coordinator
+    for subentry in coordinator.subentries_by_class.get(AddressClass.INDOOR, ()):
         async_add_entities(
             [
-                SamsungEHSNumber(entry.runtime_data.coordinator, description, subentry)
+                SamsungEHSNumber(coordinator, description, subentry)
                 for description in NUMBERS
             ],
             config_subentry_id=subentry.subentry_id,
@@ -246,22 +245,19 @@ class SamsungEHSNumber(SamsungEhsEntity, NumberEntity):
             return super().available and self.entity_description.available_fn(self)
         return super().available
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the current value."""
-        if self._device is None:
-            return None
-        if (
-            self._message is None
-            or self._message.MESSAGE_ID not in self._device.attributes
-        ):
-            return None
-        if self.entity_description.value_fn is not None:
-            return self.entity_description.value_fn(self._device)
-        value = self._device.attributes[self._message.MESSAGE_ID].VALUE
-        if value is None:
-            return None
-        return float(value)
+    @callback
+    def _update_attrs(self) -> None:
+        """Recompute the cached number value."""
+        device = self._device
+        message_id = self._message_id
+        if message_id is None or message_id not in device.attributes:
+            self._attr_native_value = None
+            return
+        if (value_fn := self.entity_description.value_fn) is not None:
+            self._attr_native_value = value_fn(device)
+            return
+        value = device.attributes[message_id].VALUE
+        self._attr_native_value = float(value) if value is not None else None
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the native value."""
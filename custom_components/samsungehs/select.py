@@ -5,10 +5,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import StrEnum
+from functools import cache
 from typing import TYPE_CHECKING
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
-from pysamsungnasa.helpers import Address
 from pysamsungnasa.protocol.enum import (
     AddressClass,
     InFsv3042DayOfWeek,
@@ -46,6 +46,12 @@ if TYPE_CHECKING:
     from .data import SamsungEhsConfigEntry
 
 
+@cache
+def _option_members(enum_cls: type[SamsungEnum]) -> dict[str, SamsungEnum]:
+    """Map rendered option labels back to their enum members."""
+    return {member.name.replace("_", " ").lower(): member for member in enum_cls}
+
+
 class SamsungEHSSelectKey(StrEnum):
     """Samsung EHS Select Keys."""
 
@@ -58,7 +64,7 @@ class SamsungEHSSelectKey(StrEnum):
     DHW_SUPPLY_RATIO = "dhw_supply_ratio"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SamsungEHSSelectEntityDescription(SelectEntityDescription):
     """Describes Samsung EHS select entity."""
 
@@ -113,14 +119,13 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up Samsung EHS select based on a config entry."""
-    for subentry in entry.subentries.values():
-        if not subentry.unique_id:
-            continue
-        if Address.parse(subentry.unique_id).class_id != AddressClass.INDOOR:
-            continue
+    # Wait for basic device info before adding entities
+    await entry.runtime_data.discovery_ready.wait()
+    coordinator = entry.runtime_data.coordinator
+    for subentry in coordinator.subentries_by_class.get(AddressClass.INDOOR, ()):
         async_add_entities(
             [
-                SamsungEHSSelect(entry.runtime_data.coordinator, description, subentry)
+                SamsungEHSSelect(coordinator, description, subentry)
                 for description in SELECTS
             ],
             config_subentry_id=subentry.subentry_id,
@@ -147,39 +152,36 @@ class SamsungEHSSelect(SamsungEhsEntity, SelectEntity):
             subentry=subentry,
         )
         self.entity_description = description
+        self._attr_options = (
+            list(convert_enum_to_select_options(description.options))
+            if description.options is not None
+            else []
+        )
 
     @property
     def current_option(self) -> str | None:
         """Return the current option."""
-        if self._device is None:
-            return None
         if (
             self._message is None
-            or self._message.MESSAGE_ID not in self._device.attributes
+            or (attribute := self._device.attributes.get(self._message.MESSAGE_ID))
+            is None
         ):
             return None
-        value = self._device.attributes[self._message.MESSAGE_ID].VALUE
+        value = attribute.VALUE
         if value is None:
             return None
-        if self.options and isinstance(value, int) and 0 <= value < len(self.options):
-            return self.options[value]
+        options = self.entity_description.options
+        if options is not None and isinstance(value, int):
+            labels = convert_enum_to_select_options(options)
+            if 0 <= value < len(labels):
+                return labels[value]
         return str(value)
 
-    @property
-    def options(self) -> list[str]:
-        """Return the list of available options."""
-        if self.entity_description.options is not None:
-            return convert_enum_to_select_options(self.entity_description.options)
-        return []
-
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        if self._message is None or self.entity_description.options is None:
+        options = self.entity_description.options
+        if self._message is None or options is None:
             return
-        try:
-            value = self.options.index(option.lower())
-            # Convert int to enum
-            value = self.entity_description.options(value)
-            await self._device.write_attribute(self._message, value=value)
-        except ValueError:
-            pass
+        member = _option_members(options).get(option.lower())
+        if member is not None:
+            await self._device.write_attribute(self._message, value=member)
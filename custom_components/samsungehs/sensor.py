@@ -5,7 +5,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import StrEnum
-from typing import TYPE_CHECKING, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -20,14 +21,14 @@ from homeassistant.const import (
     UnitOfPower,
     UnitOfTemperature,
 )
-from pysamsungnasa.helpers import Address
+from homeassistant.core import callback
 from pysamsungnasa.protocol.enum import AddressClass
 from pysamsungnasa.protocol.factory.messages import basic, indoor, outdoor
 
 from .entity import SamsungEhsEntity
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
     from homeassistant.config_entries import ConfigSubentry
     from homeassistant.core import HomeAssistant
@@ -81,7 +82,7 @@ class SamsungEhsSensorKey(StrEnum):
     DHW_MAX_OPERATING_TIME = "dhw_max_operating_time"
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class SamsungEhsSensorEntityDescription(SensorEntityDescription):
     """Description for Samsung EHS sensor entities."""
 
@@ -90,6 +91,30 @@ class SamsungEhsSensorEntityDescription(SensorEntityDescription):
     )
     message: type[BaseMessage] | None = None
     value_fn: Callable[[NasaDevice], Any] | None = None
+    supported_fn: Callable[[NasaDevice], bool] | None = None
+
+
+def _count_attrs(device: NasaDevice) -> int:
+    """Return the number of attributes the device has reported."""
+    return len(device.attributes)
+
+
+def _compute_cop(
+    device: NasaDevice,
+    _generated_id: int = indoor.TotalEnergyGenerated.MESSAGE_ID,
+    _consumed_id: int = outdoor.OutdoorCumulativeEnergy.MESSAGE_ID,
+) -> float | None:
+    """Return the coefficient of performance from the cumulative counters."""
+    attributes = device.attributes
+    consumed = attributes.get(_consumed_id)
+    generated = attributes.get(_generated_id)
+    if consumed is None or generated is None:
+        return None
+    consumption = consumed.VALUE
+    generation = generated.VALUE
+    if not consumption or generation is None:
+        return None
+    return generation / consumption
 
 
 ALL_ENTITY_DESCRIPTIONS: tuple[SamsungEhsSensorEntityDescription, ...] = (
@@ -97,7 +122,7 @@ ALL_ENTITY_DESCRIPTIONS: tuple[SamsungEhsSensorEntityDescription, ...] = (
         key=SamsungEhsSensorKey.AVAILABLE_ATTRIBUTES,
         translation_key=SamsungEhsSensorKey.AVAILABLE_ATTRIBUTES,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda device: len(device.attributes),
+        value_fn=_count_attrs,
         state_class=SensorStateClass.MEASUREMENT,
     ),
     SamsungEhsSensorEntityDescription(
@@ -120,26 +145,7 @@ OUTDOOR_ENTITY_DESCRIPTIONS: tuple[SamsungEhsSensorEntityDescription, ...] = (
     SamsungEhsSensorEntityDescription(
         key=SamsungEhsSensorKey.OUTDOOR_COP,
         translation_key=SamsungEhsSensorKey.OUTDOOR_COP,
-        value_fn=lambda device: (
-            (
-                indoor.TotalEnergyGenerated.MESSAGE_ID in device.attributes
-                and outdoor.OutdoorCumulativeEnergy.MESSAGE_ID in device.attributes
-                and (
-                    consumption := device.attributes[
-                        outdoor.OutdoorCumulativeEnergy.MESSAGE_ID
-                    ].VALUE
-                )
-                != 0
-                and (
-                    generation := device.attributes[
-                        indoor.TotalEnergyGenerated.MESSAGE_ID
-                    ].VALUE
-                )
-                is not None
-                and generation / consumption
-            )
-            or None
-        ),
+        value_fn=_compute_cop,
         state_class=SensorStateClass.MEASUREMENT,
     ),
     SamsungEhsSensorEntityDescription(
@@ -357,6 +363,29 @@ INDOOR_ENTITY_DESCRIPTIONS: tuple[SamsungEhsSensorEntityDescription, ...] = (
     ),
 )
 
+# Value reported by the unit for sensors it does not support
+_UNAVAILABLE: Final = "ffff"
+
+# Shared empty mapping so non-diagnostic sensors don't allocate per read
+_EMPTY_ATTRS: Final[Mapping[int, Any]] = MappingProxyType({})
+
+# Shared descriptions pre-merged with the class-specific ones at import
+_DESCRIPTIONS_BY_CLASS: Final[
+    dict[AddressClass, tuple[SamsungEhsSensorEntityDescription, ...]]
+] = {
+    AddressClass.OUTDOOR: ALL_ENTITY_DESCRIPTIONS + OUTDOOR_ENTITY_DESCRIPTIONS,
+    AddressClass.INDOOR: ALL_ENTITY_DESCRIPTIONS + INDOOR_ENTITY_DESCRIPTIONS,
+}
+
+
+def _is_supported(
+    description: SamsungEhsSensorEntityDescription, device: NasaDevice | None
+) -> bool:
+    """Return whether a description applies to the discovered device."""
+    if description.supported_fn is None:
+        return True
+    return device is not None and description.supported_fn(device)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,  # pylint: disable=W0613
@@ -364,45 +393,28 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up the sensor platform."""
+    # Wait for basic device info before adding entities
+    await entry.runtime_data.discovery_ready.wait()
     # Register devices in the device registry
-    for subentry in entry.subentries.values():
-        assert subentry.unique_id is not None  # noqa: S101
-        address = Address.parse(subentry.unique_id)
-        async_add_entities(
-            [
+    coordinator = entry.runtime_data.coordinator
+    devices = entry.runtime_data.client.devices
+    for class_id, subentries in coordinator.subentries_by_class.items():
+        descriptions = _DESCRIPTIONS_BY_CLASS.get(class_id, ALL_ENTITY_DESCRIPTIONS)
+        for subentry in subentries:
+            device = devices.get(subentry.unique_id)
+            entities = [
                 SamsungEhsSensor(
-                    coordinator=entry.runtime_data.coordinator,
+                    coordinator=coordinator,
                     subentry=subentry,
                     entity_description=entity_description,
                 )
-                for entity_description in ALL_ENTITY_DESCRIPTIONS
-            ],
-            config_subentry_id=subentry.subentry_id,
-        )
-        if address.class_id == AddressClass.OUTDOOR:
-            async_add_entities(
-                [
-                    SamsungEhsSensor(
-                        coordinator=entry.runtime_data.coordinator,
-                        subentry=subentry,
-                        entity_description=entity_description,
-                    )
-                    for entity_description in OUTDOOR_ENTITY_DESCRIPTIONS
-                ],
-                config_subentry_id=subentry.subentry_id,
-            )
-        elif address.class_id == AddressClass.INDOOR:
-            async_add_entities(
-                [
-                    SamsungEhsSensor(
-                        coordinator=entry.runtime_data.coordinator,
-                        subentry=subentry,
-                        entity_description=entity_description,
-                    )
-                    for entity_description in INDOOR_ENTITY_DESCRIPTIONS
-                ],
-                config_subentry_id=subentry.subentry_id,
-            )
+                for entity_description in descriptions
+                if _is_supported(entity_description, device)
+            ]
+            if entities:
+                async_add_entities(
+                    entities, config_subentry_id=subentry.subentry_id
+                )
 
 
 class SamsungEhsSensor(SamsungEhsEntity, SensorEntity):
@@ -425,75 +437,69 @@ class SamsungEhsSensor(SamsungEhsEntity, SensorEntity):
             requires_read=entity_description.requires_read,
         )
         self.entity_description = entity_description
-
-    @property
-    def native_value(self) -> int | float | None:
-        """Return the native value."""
-        if self._device is None:
-            return None
-        if self.entity_description.message is not None:
-            if self.entity_description.message.MESSAGE_ID in self._device.attributes:
-                val = self._device.attributes[
-                    self.entity_description.message.MESSAGE_ID
-                ].VALUE
-                if val == "ffff":  # Sensor not available for this device
-                    return None
-                return val
-            return None
-        if self.entity_description.value_fn is None:
-            return None
-        return self.entity_description.value_fn(self._device)
+        self._is_available_attrs = (
+            entity_description.key is SamsungEhsSensorKey.AVAILABLE_ATTRIBUTES
+        )
+        self._attrs_cache: dict[int, Any] | None = None
+        self._value_fn = entity_description.value_fn
 
     @property
     def available(self) -> bool:
         """Return if the sensor is available."""
-        if self._device is None:
-            return False
-        if (
-            self.entity_description.value_fn is None
-            and self.entity_description.message is None
-        ):
-            return False
-        if self.entity_description.message is None:
-            return True
+        message_id = self._message_id
+        if message_id is None:
+            return self._value_fn is not None
+        client = self._client
         return (
-            self.coordinator.config_entry.runtime_data.client.client.is_connected
-            and self.entity_description.message.MESSAGE_ID in self._device.attributes
-            and self._device.attributes[
-                self.entity_description.message.MESSAGE_ID
-            ].VALUE
-            != "ffff"
+            client.client.is_connected
+            and self._device_address in client.devices
+            and (attribute := self._device.attributes.get(message_id)) is not None
+            and attribute.VALUE != _UNAVAILABLE
         )
 
     @property
-    def extra_state_attributes(self) -> dict[int, Any]:
+    def extra_state_attributes(self) -> Mapping[int, Any]:
         """Return extra state attributes."""
-        if self.entity_description.key is not SamsungEhsSensorKey.AVAILABLE_ATTRIBUTES:
-            return {}
-        if self._device is None:
-            return {}
-        return {
-            msg_number: {
-                "name": value.MESSAGE_NAME,
-                "value": str(value.VALUE),
+        if not self._is_available_attrs:
+            return _EMPTY_ATTRS
+        cached = self._attrs_cache
+        if cached is None:
+            cached = self._attrs_cache = {
+                msg_number: (
+                    value.MESSAGE_NAME,
+                    val
+                    if isinstance(val := value.VALUE, str | int | float | bool)
+                    else str(val),
+                )
+                for msg_number, value in self._device.attributes.items()
             }
-            for msg_number, value in self._device.attributes.items()
-        }
+        return cached
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Recompute cached state when the device reports new data."""
+        self._attrs_cache = None
+        message_id = self._message_id
+        if message_id is not None:
+            attribute = self._device.attributes.get(message_id)
+            val = attribute.VALUE if attribute is not None else None
+            # "ffff" means the sensor is not available for this device
+            self._attr_native_value = None if val == _UNAVAILABLE else val
+            return
+        value_fn = self._value_fn
+        self._attr_native_value = (
+            value_fn(self._device) if value_fn is not None else None
+        )
 
     async def async_added_to_hass(self) -> None:
         """Execute when entity is added to hass."""
         # We need to subscribe to updates for two messages
         # These are added because they are part of a different type of NASA device
-        if self.entity_description.message is None:
-            return await super().async_added_to_hass()
         if (
-            self.entity_description.message.MESSAGE_ID in (0x4426, 0x4427)
-            and self._device.device_type == AddressClass.OUTDOOR
+            self._message_id in (0x4426, 0x4427)
+            and self._device.device_type is AddressClass.OUTDOOR
         ):
-            self.coordinator.config_entry.runtime_data.client.parser.add_packet_listener(
-                0x4426, self._device.handle_packet
-            )
-            self.coordinator.config_entry.runtime_data.client.parser.add_packet_listener(
-                0x4427, self._device.handle_packet
-            )
+            handle_packet = self._device.handle_packet
+            self.coordinator.ensure_packet_listener(0x4426, handle_packet)
+            self.coordinator.ensure_packet_listener(0x4427, handle_packet)
         return await super().async_added_to_hass()
@@ -1,12 +1,15 @@
 """Services for Samsung EHS integration."""
 
+from __future__ import annotations
+
 import logging
 from enum import StrEnum
+from functools import cache
 from typing import TYPE_CHECKING
 
 import voluptuous as vol
 from homeassistant.const import ATTR_DEVICE_ID
-from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse, callback
+from homeassistant.core import SupportsResponse, callback
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
@@ -16,6 +19,8 @@ from pysamsungnasa.protocol.factory.types import BaseMessage, RawMessage
 from .const import DOMAIN
 
 if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, ServiceCall
+
     from .data import SamsungEhsConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
@@ -81,33 +86,22 @@ def _get_device_from_call(call: ServiceCall) -> dr.DeviceEntry:
 
 def _get_device_address(device: dr.DeviceEntry) -> str | None:
     """Get device address from device entry."""
-    for identifier in device.identifiers:
-        if identifier[0] == DOMAIN:
-            return identifier[1].split("_")[1]
+    for domain, identifier in device.identifiers:
+        if domain == DOMAIN:
+            return identifier.partition("_")[2] or None
     return None
 
 
-def _get_attribute_class_by_id(attribute_id: int) -> BaseMessage:
-    """Get attribute class by its ID."""
-    attribute = MESSAGE_PARSERS.get(attribute_id)
-    if attribute:
-        return attribute
-
-    class DummyRawMessage(RawMessage):
-        MESSAGE_ID = attribute_id
-
-    return DummyRawMessage
-
-
-async def async_read_attribute_service(call: ServiceCall) -> dict:
-    """Handle read attribute service call."""
+def _resolve_device(
+    call: ServiceCall, attribute_id: int
+) -> tuple[SamsungEhsConfigEntry, str]:
+    """Resolve the config entry and device address targeted by a service call."""
+    device = _get_device_from_call(call)
     config_entry: SamsungEhsConfigEntry | None = None
-    address: str | None = None
-    attribute_to_read: int = call.data["attribute"]  # (format in 0xXXXX)
-    device: dr.DeviceEntry = _get_device_from_call(call)
     for entry_id in device.config_entries:
-        config_entry = call.hass.config_entries.async_get_entry(entry_id)
-        if config_entry and config_entry.domain == DOMAIN:
+        entry = call.hass.config_entries.async_get_entry(entry_id)
+        if entry and entry.domain == DOMAIN:
+            config_entry = entry
             break
 
     address = _get_device_address(device)
@@ -117,11 +111,30 @@ async def async_read_attribute_service(call: ServiceCall) -> dict:
             translation_domain=DOMAIN,
             translation_key="invalid_device",
             translation_placeholders={
-                "attribute": str(attribute_to_read),
+                "attribute": str(attribute_id),
                 "device_id": device.id,
             },
         )
+    return config_entry, address
+
 
+@cache
+def _get_attribute_class_by_id(attribute_id: int) -> type[BaseMessage]:
+    """Get attribute class by its ID."""
+    attribute = MESSAGE_PARSERS.get(attribute_id)
+    if attribute:
+        return attribute
+
+    class DummyRawMessage(RawMessage):
+        MESSAGE_ID = attribute_id
+
+    return DummyRawMessage
+
+
+async def async_read_attribute_service(call: ServiceCall) -> dict:
+    """Handle read attribute service call."""
+    attribute_to_read: int = call.data["attribute"]  # (format in 0xXXXX)
+    config_entry, address = _resolve_device(call, attribute_to_read)
     attribute = _get_attribute_class_by_id(attribute_to_read)
     message = await config_entry.runtime_data.client.devices[address].get_attribute(
         attribute,
@@ -138,27 +151,9 @@ async def async_read_attribute_service(call: ServiceCall) -> dict:
 
 async def async_write_attribute_service(call: ServiceCall) -> None:
     """Handle write attribute service call."""
-    config_entry: SamsungEhsConfigEntry | None = None
-    address: str | None = None
     attribute_to_write: int = call.data["attribute"]  # (format in 0xXXXX)
     value_to_write: int = call.data["value"]
-    device: dr.DeviceEntry = _get_device_from_call(call)
-    for entry_id in device.config_entries:
-        config_entry = call.hass.config_entries.async_get_entry(entry_id)
-        if config_entry and config_entry.domain == DOMAIN:
-            break
-
-    address = _get_device_address(device)
-
-    if not config_entry or not address:
-        raise ServiceValidationError(
-            translation_domain=DOMAIN,
-            translation_key="invalid_device",
-            translation_placeholders={
-                "attribute": str(attribute_to_write),
-                "device_id": device.id,
-            },
-        )
+    config_entry, address = _resolve_device(call, attribute_to_write)
     attribute = _get_attribute_class_by_id(attribute_to_write)
     await config_entry.runtime_data.client.devices[address].write_attribute(
         attribute, value_to_write
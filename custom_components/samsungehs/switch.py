@@ -11,7 +11,6 @@ from homeassistant.components.switch import (
     SwitchEntity,
     SwitchEntityDescription,
 )
-from pysamsungnasa.helpers import Address
 from pysamsungnasa.protocol.enum import (
     AddressClass,
 )
@@ -83,14 +82,13 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up Samsung EHS switch based on a config entry."""
-    for subentry in entry.subentries.values():
-        if not subentry.unique_id:
-            continue
-        if Address.parse(subentry.unique_id).class_id != AddressClass.INDOOR:
-            continue
+    # Wait for basic device info before adding entities
+    await entry.runtime_data.discovery_ready.wait()
+    coordinator = entry.runtime_data.coordinator
+    for subentry in coordinator.subentries_by_class.get(AddressClass.INDOOR, ()):
         async_add_entities(
             [
-                SamsungEHSSwitch(entry.runtime_data.coordinator, description, subentry)
+                SamsungEHSSwitch(coordinator, description, subentry)
                 for description in SWITCHES
             ],
             config_subentry_id=subentry.subentry_id,
@@ -121,8 +119,6 @@ class SamsungEHSSwitch(SamsungEhsEntity, SwitchEntity):
     @property
     def is_on(self) -> bool | None:
         """Return true if the switch is on."""
-        if self._device is None:
-            return None
         if (
             self._message is None
             or self._message.MESSAGE_ID not in self._device.attributes
@@ -130,14 +126,16 @@ class SamsungEHSSwitch(SamsungEhsEntity, SwitchEntity):
             return None
         return self._device.attributes[self._message.MESSAGE_ID].VALUE
 
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn the switch on."""
+    async def _write(self, value: bool) -> None:
+        """Write the switch state to the device."""
         if self._message is None:
             return
-        await self._device.write_attribute(self._message, value=True)
+        await self._device.write_attribute(self._message, value=value)
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the switch on."""
+        await self._write(value=True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
-        if self._message is None:
-            return
-        await self._device.write_attribute(self._message, value=False)
+        await self._write(value=False)
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final
 
 from homeassistant.components.water_heater import (
     STATE_ECO,
@@ -14,7 +15,7 @@ from homeassistant.components.water_heater import (
     WaterHeaterEntityFeature,
 )
 from homeassistant.const import STATE_OFF, UnitOfTemperature
-from pysamsungnasa.helpers import Address
+from homeassistant.core import callback
 from pysamsungnasa.protocol.enum import AddressClass, DataType, DhwOpMode
 from pysamsungnasa.protocol.factory.messages.indoor import (
     DhwCurrentTemperature,
@@ -33,19 +34,27 @@ if TYPE_CHECKING:
     from .coordinator import SamsungEhsDataUpdateCoordinator
     from .data import SamsungEhsConfigEntry
 
-EHS_TO_HASS_STATE = {
-    DhwOpMode.ECO: STATE_ECO,
-    DhwOpMode.STANDARD: STATE_HEAT_PUMP,
-    DhwOpMode.POWER: STATE_PERFORMANCE,
-    DhwOpMode.FORCE: STATE_ELECTRIC,
-}
+EHS_TO_HASS_STATE: Final = MappingProxyType(
+    {
+        DhwOpMode.ECO: STATE_ECO,
+        DhwOpMode.STANDARD: STATE_HEAT_PUMP,
+        DhwOpMode.POWER: STATE_PERFORMANCE,
+        DhwOpMode.FORCE: STATE_ELECTRIC,
+    }
+)
+
+HASS_TO_EHS_STATE: Final = MappingProxyType(
+    {hass_state: ehs_mode for ehs_mode, hass_state in EHS_TO_HASS_STATE.items()}
+)
 
-HASS_TO_EHS_STATE = {
-    STATE_ECO: DhwOpMode.ECO,
-    STATE_HEAT_PUMP: DhwOpMode.STANDARD,
-    STATE_PERFORMANCE: DhwOpMode.POWER,
-    STATE_ELECTRIC: DhwOpMode.FORCE,
-}
+# Prebound for the per-read state lookup
+_EHS_TO_HASS_GET = EHS_TO_HASS_STATE.get
+
+# Resolved once so _update_attrs avoids the class-attribute chains
+_CURRENT_TEMP_MID: Final = DhwCurrentTemperature.MESSAGE_ID
+_TARGET_TEMP_MID: Final = DhwTargetTemperature.MESSAGE_ID
+_OP_MODE_MID: Final = InDhwOpMode.MESSAGE_ID
+_POWER_MID: Final = InDhwWaterHeaterPower.MESSAGE_ID
 
 SUPPORTED_STATES = [
     STATE_OFF,
@@ -66,15 +75,14 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up the water heater platform."""
-    for subentry in entry.subentries.values():
-        assert subentry.unique_id is not None  # noqa: S101
-        address = Address.parse(subentry.unique_id)
-        if address.class_id != AddressClass.INDOOR:
-            continue
+    # Wait for basic device info before adding entities
+    await entry.runtime_data.discovery_ready.wait()
+    coordinator = entry.runtime_data.coordinator
+    for subentry in coordinator.subentries_by_class.get(AddressClass.INDOOR, ()):
         async_add_entities(
             [
                 SamsungEhsWaterHeater(
-                    coordinator=entry.runtime_data.coordinator,
+                    coordinator=coordinator,
                     entity_description=entity_description,
                     subentry=subentry,
                 )
@@ -90,6 +98,11 @@ class SamsungEhsWaterHeater(SamsungEhsEntity, WaterHeaterEntity):
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_operation_list = SUPPORTED_STATES
     _attr_translation_key = "dhw"
+    _attr_supported_features = (
+        WaterHeaterEntityFeature.TARGET_TEMPERATURE
+        | WaterHeaterEntityFeature.ON_OFF
+        | WaterHeaterEntityFeature.OPERATION_MODE
+    )
 
     def __init__(
         self,
@@ -106,37 +119,27 @@ class SamsungEhsWaterHeater(SamsungEhsEntity, WaterHeaterEntity):
         )
         self.entity_description = entity_description
 
-    @property
-    def supported_features(self) -> int:
-        """Return the list of supported features."""
-        return (
-            WaterHeaterEntityFeature.TARGET_TEMPERATURE
-            | WaterHeaterEntityFeature.ON_OFF
-            | WaterHeaterEntityFeature.OPERATION_MODE
-        )
-
-    @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature."""
-        value = self.get_attribute(DhwCurrentTemperature)
-        return float(value) if value is not None else None
-
-    @property
-    def target_temperature(self) -> float | None:
-        """Return the target temperature."""
-        value = self.get_attribute(DhwTargetTemperature)
-        return float(value) if value is not None else None
-
-    @property
-    def current_operation(self) -> str | None:
-        """Return the current operation."""
+    @callback
+    def _update_attrs(self) -> None:
+        """Recompute the cached temperatures and operation state."""
+        attributes = self._device.attributes
+        attribute = attributes.get(_CURRENT_TEMP_MID)
+        value = attribute.VALUE if attribute is not None else None
+        self._attr_current_temperature = float(value) if value is not None else None
+        attribute = attributes.get(_TARGET_TEMP_MID)
+        value = attribute.VALUE if attribute is not None else None
+        self._attr_target_temperature = float(value) if value is not None else None
         # Check if DHW is off first
-        if not self.get_attribute(InDhwWaterHeaterPower):
-            return STATE_OFF
-        op_mode = self.get_attribute(InDhwOpMode)
-        if op_mode is None or not isinstance(op_mode, DhwOpMode):
-            return None
-        return EHS_TO_HASS_STATE.get(op_mode)
+        power = attributes.get(_POWER_MID)
+        if power is None or not power.VALUE:
+            self._attr_current_operation = STATE_OFF
+            return
+        attribute = attributes.get(_OP_MODE_MID)
+        op_mode = attribute.VALUE if attribute is not None else None
+        if not isinstance(op_mode, DhwOpMode):
+            self._attr_current_operation = None
+            return
+        self._attr_current_operation = _EHS_TO_HASS_GET(op_mode)
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
@@ -149,11 +152,16 @@ class SamsungEhsWaterHeater(SamsungEhsEntity, WaterHeaterEntity):
         if operation_mode == STATE_OFF:
             await self.async_turn_off()
             return
+        mode = HASS_TO_EHS_STATE[operation_mode]
+        if self.get_attribute(InDhwWaterHeaterPower):
+            # Already powered on, only the mode needs to change.
+            await self._device.write_attribute(InDhwOpMode, mode, mode=DataType.REQUEST)
+            return
         # Turn dhw power on and send new mode.
         await self._device.write_attributes(
             {
                 InDhwWaterHeaterPower: True,
-                InDhwOpMode: HASS_TO_EHS_STATE[operation_mode],
+                InDhwOpMode: mode,
             },
             mode=DataType.REQUEST,
         )